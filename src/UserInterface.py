@@ -1,7 +1,7 @@
 import tkinter as tk
 from tkinter import ttk
 
-from Sudoku import Sudoku
+from sudoku_solver import Sudoku
 
 
 class UserInterface:
@@ -129,7 +129,11 @@ class UserInterface:
         self.master.update()
         self.wait_label.config(text="")
         grid = self.get_grid()
-        sudoku_solver = Sudoku(grid)
+        try:
+            sudoku_solver = Sudoku(grid)
+        except ValueError as error:
+            self.wait_label.configure(text=f'Invalid puzzle: {error}')
+            return
         result = sudoku_solver.solve_sudoku()
         self.set_grid(result.values)
         self.wait_label.configure(text="")
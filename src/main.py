@@ -1,10 +1,19 @@
-from UserInterface import UserInterface
+import sys
 
-import tkinter as tk
-from tkinter import ttk
 
+def run_gui() -> None:
+    """
+    Start the sudoku solver GUI.
+
+    `tkinter` and the GUI are imported here, so the solver modules can be used on machines without a display.
+
+    :return: None
+    """
+    import tkinter as tk
+    from tkinter import ttk
+
+    from UserInterface import UserInterface
 
-if __name__ == '__main__':
     root = tk.Tk()
     s = ttk.Style(root)
     s.configure('Green.TButton', font=("Helvetica", 16), background='#26a69a')
@@ -12,3 +21,12 @@ if __name__ == '__main__':
     s.configure('Yellow.TEntry', font=("Helvetica", 16), background='#fff9c4')
     app = UserInterface(root)
     root.mainloop()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        from sudoku_solver.headless import run_headless
+
+        run_headless(sys.argv[1])
+    else:
+        run_gui()
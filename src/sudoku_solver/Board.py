@@ -1,5 +1,4 @@
 from random import uniform, randint
-from copy import deepcopy
 
 
 class Board:
@@ -10,11 +9,11 @@ class Board:
 
         :param values: A list of values representing the sudoku board.
         :type values: list
-        :ivar values: A deep copy of the `values` input parameter.
+        :ivar values: A copy of the `values` input parameter, with each row copied.
         :ivar given_board: A reference to the original `values` input parameter.
         :ivar fitness_score: The fitness score of the sudoku board, initially set to None.
         """
-        self.values = deepcopy(values)
+        self.values = [list(row) for row in values]
         self.given_board = values
         self.fitness_score = None
 
@@ -73,15 +72,15 @@ class Board:
         The function checks if the filled row has duplicate values, and if so, refills the row with new values.
         """
         # This list has possible answers for each cell of the sudoku
-        helper_board = Board([[list() for _ in range(9)] for _ in range(9)])
+        helper_board = [[list() for _ in range(9)] for _ in range(9)]
         # This piece of code, generate possible numbers for each cell
         for row in range(9):
             for column in range(9):
                 for value in range(1, 10):
                     if self.check_duplication_for_generation(row, column, value):
-                        helper_board.values[row][column].append(value)
+                        helper_board[row][column].append(value)
                     elif self.given_board[row][column] != 0:
-                        helper_board.values[row][column].append(self.given_board[row][column])
+                        helper_board[row][column].append(self.given_board[row][column])
                         break
         # This piece of code fills the sudoku table
         for row in range(9):
@@ -93,14 +92,14 @@ class Board:
                 # This means this cell has to be filled randomly
                 elif self.given_board[row][column] == 0:
                     this_row[column] = \
-                        helper_board.values[row][column][randint(0, len(helper_board.values[row][column]) - 1)]
+                        helper_board[row][column][randint(0, len(helper_board[row][column]) - 1)]
             # This means this row has duplicate numbers
             while len(set(this_row)) != 9:
                 for column in range(9):
                     # We change the numbers those are not given by the question, since we have an acceptable answer
                     if self.given_board[row][column] == 0:
                         this_row[column] = \
-                            helper_board.values[row][column][randint(0, len(helper_board.values[row][column]) - 1)]
+                            helper_board[row][column][randint(0, len(helper_board[row][column]) - 1)]
             self.values[row] = this_row
 
     def check_row_duplication(self, row: int, value: int) -> bool:
@@ -1,7 +1,6 @@
-from Board import Board
+from .Board import Board
 
 from random import uniform, randint
-from copy import deepcopy
 
 
 class CrossOver:
@@ -35,26 +34,48 @@ class CrossOver:
     
     def cross_over(self, parent_one: Board, parent_two: Board, cross_over_rate: float) -> tuple:
         """
-        Perform a cross-over between two parents to generate two children.
-        
-        The function takes two parents, `parent_one` and `parent_two`, and a crossover rate, `cross_over_rate`, as input.
-        Based on a random probability generated using `uniform` function, a cross-over is performed between the parents if the probability is less than `cross_over_rate`. 
-        During the cross-over, two cut-off points are chosen randomly between 0 and 8, and 1 and 9. 
-        The values of the children are merged based on these cut-off points using `__cross_over_rows` function for each row.
-        
+        Perform a cross-over between two parents to generate two new children.
+
+        This function allocates two new `Board` objects and fills them using `cross_over_into`.
+        Use `cross_over_into` directly to write the children into already allocated boards.
+
         :param parent_one: The first parent used in the cross-over.
         :type parent_one: Board
         :param parent_two: The second parent used in the cross-over.
         :type parent_two: Board
         :param cross_over_rate: The probability that the cross-over will occur between the two parents.
         :type cross_over_rate: float
-        
+
         :return: The first and second children generated after cross-over.
         :rtype: tuple(Board, Board)
         """
         child_one, child_two = Board(parent_one.given_board), Board(parent_two.given_board)
-        child_one.values = deepcopy(parent_one.values)
-        child_two.values = deepcopy(parent_two.values)
+        self.cross_over_into(parent_one, parent_two, child_one, child_two, cross_over_rate)
+        return child_one, child_two
+
+    def cross_over_into(self, parent_one: Board, parent_two: Board, child_one: Board, child_two: Board,
+                        cross_over_rate: float) -> None:
+        """
+        Perform a cross-over between two parents and write the two children in place.
+
+        Based on a random probability generated using `uniform` function, a cross-over is performed between the parents if the probability is less than `cross_over_rate`.
+        During the cross-over, two cut-off points are chosen randomly between 0 and 8, and 1 and 9.
+        The rows between these cut-off points are merged using `__cross_over_rows` function, and the other rows are copied from the parents.
+        The children must not be the same objects as the parents, since the parents are read while the children are written.
+
+        :param parent_one: The first parent used in the cross-over.
+        :type parent_one: Board
+        :param parent_two: The second parent used in the cross-over.
+        :type parent_two: Board
+        :param child_one: The board which the first child is written into.
+        :type child_one: Board
+        :param child_two: The board which the second child is written into.
+        :type child_two: Board
+        :param cross_over_rate: The probability that the cross-over will occur between the two parents.
+        :type cross_over_rate: float
+        :return: None
+        """
+        cross_over_point_one, cross_over_point_two = 0, 0
         probability = uniform(0, 1)
         if probability < cross_over_rate:
             # Two cut off will be chosen to merge the parent between these two
@@ -65,15 +86,21 @@ class CrossOver:
             if cross_over_point_one > cross_over_point_two:
                 cross_over_point_one, cross_over_point_two = \
                 cross_over_point_two, cross_over_point_one
-            # The merge will be done based on __cross_over_rows() function for each row
-            for row_number in range(cross_over_point_one, cross_over_point_two):
-                child_one.values[row_number], child_two.values[row_number] = \
-                self.__cross_over_rows(child_one.values[row_number], child_two.values[row_number])
-        return child_one, child_two
-            
-    def __cross_over_rows(self, row_one: list, row_two: list) -> tuple:
+        for row_number in range(9):
+            # The merge will be done based on __cross_over_rows() function for each row between the cut offs
+            if cross_over_point_one <= row_number < cross_over_point_two:
+                self.__cross_over_rows(parent_one.values[row_number], parent_two.values[row_number],
+                                       child_one.values[row_number], child_two.values[row_number])
+            # Other rows are copied from the parents without allocating new rows
+            else:
+                child_one.values[row_number][:] = parent_one.values[row_number]
+                child_two.values[row_number][:] = parent_two.values[row_number]
+        child_one.fitness_score = None
+        child_two.fitness_score = None
+
+    def __cross_over_rows(self, row_one: list, row_two: list, child_one_row: list, child_two_row: list) -> None:
         """
-        This function takes in two rows (row_one and row_two) as arguments and performs a crossover operation on these two rows to generate two child rows.
+        This function takes in two rows (row_one and row_two) as arguments and performs a crossover operation on these two rows to fill two child rows in place.
         The crossover operation uses two while loops, where each loop runs until both child_one_row and child_two_row are filled with numbers 1 to 9.
 
         In each iteration, the function finds the first number in the first parent row which is also in the remaining_numbers list.
@@ -85,18 +112,20 @@ class CrossOver:
         If they are not the same, the function removes both numbers from the remaining_numbers list and repeats the process until they are the same.
         The function increments the cycle_number value after each iteration, which ensures that the crossover operation is performed randomly.
 
-        Finally, the function returns the two child rows generated from the crossover operation.
-
         :param row_one: The first row used in the crossover operation
         :type row_one: list
         :param row_two: The second row used in the crossover operation
         :type row_two: list
+        :param child_one_row: The first child row, which is overwritten by the crossover operation
+        :type child_one_row: list
+        :param child_two_row: The second child row, which is overwritten by the crossover operation
+        :type child_two_row: list
 
-        :return: A tuple of two child rows generated from the crossover operation
-        :rtype: tuple(list, list)
+        :return: None
         """
-        child_one_row = [0 for _ in range(9)]
-        child_two_row = [0 for _ in range(9)]
+        for column in range(9):
+            child_one_row[column] = 0
+            child_two_row[column] = 0
         remaining_numbers = [number for number in range(1, 10)]
         # This value will be used to mix two rows almost random
         cycle_number = 0
@@ -143,7 +172,6 @@ class CrossOver:
                     remaining_numbers.remove(row_one[index])
                 next_numebr = row_two[index]
             cycle_number += 1
-        return child_one_row, child_two_row
 
     def __find_unused_number(self, parent_row: list, remaining_numbers: list) -> int:
         """
@@ -1,4 +1,6 @@
-from Board import Board
+import sys
+
+from .Board import Board
 
 
 class Population:
@@ -8,6 +10,11 @@ class Population:
         Initialize a Population object and generates number of randomly filled boards
         and calculates their fitness scores.
 
+        Two pools of boards are allocated once: `candidates` holds the current generation and
+        `offspring` holds the boards which the next generation is written into. The pools are swapped
+        by `swap_generations`, so no board is allocated after the population is initialized.
+        Since offsprings are generated in pairs, the size of each pool is rounded up to an even number.
+
         :param size_of_population: Number of Board objects in this population.
         :type size_of_population: int
         :param given_board: A 2-dimensional list that represents the initial state of the board.
@@ -16,20 +23,22 @@ class Population:
         :rtype: None
         """
 
-        self.size_of_population = size_of_population
+        self.size_of_population = size_of_population + size_of_population % 2
         self.candidates = list()
+        self.offspring = list()
 
-        print(f'Start generating population with size {self.size_of_population}. (This may take a while, please be patient)')
+        print(f'Start generating population with size {self.size_of_population}. (This may take a while, please be patient)', file=sys.stderr)
         percentage = 1
         for counter in range(self.size_of_population):
             if counter == percentage * self.size_of_population // 10:
-                print(f' - {percentage * 10}% of all candidates are generated...')
+                print(f' - {percentage * 10}% of all candidates are generated...', file=sys.stderr)
                 percentage += 1
             this_candidate = Board(given_board)
             this_candidate.fill_board()
             self.candidates.append(this_candidate)
+            self.offspring.append(Board(given_board))
         self.update_fitness()
-        print(f'{self.size_of_population} boards were generated successfully. :)')
+        print(f'{self.size_of_population} boards were generated successfully. :)', file=sys.stderr)
 
     def update_fitness(self) -> None:
         """
@@ -42,6 +51,16 @@ class Population:
         for candidate in self.candidates:
             candidate.update_fitness_score()
 
+    def swap_generations(self) -> None:
+        """
+        Make the offspring pool the current generation and update its fitness scores.
+
+        The boards of the previous generation are kept in the `offspring` pool and are
+        overwritten when the next generation is generated.
+        """
+        self.candidates, self.offspring = self.offspring, self.candidates
+        self.update_fitness()
+
     def sort_based_on_fitness_score(self) -> None:
         """
         This method sorts the candidate boards based on their fitness scores in descending order.
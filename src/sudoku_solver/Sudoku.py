@@ -1,5 +1,7 @@
-from Population import Population
-from CrossOver import CrossOver
+import sys
+
+from .Population import Population
+from .CrossOver import CrossOver
 
 
 class Sudoku:
@@ -10,11 +12,36 @@ class Sudoku:
 
         :param given_board: A NxN 2D list representing the Sudoku problem.
         :type given_board: list
+        :raises ValueError: If a number is given more than once in a row, column or subgrid.
         """
+        self.check_given_board(given_board)
         self.given_board = given_board
         self.population = None
         self.cross_over = CrossOver()
 
+    @staticmethod
+    def check_given_board(board: list) -> None:
+        """
+        Check that the given numbers of a sudoku problem are consistent.
+
+        A sudoku problem with the same given number twice in a row, column or 3x3 subgrid has no
+        answer, and the genetic algorithm would never finish generating its population.
+
+        :param board: A 9x9 2D list representing the sudoku problem, with 0 for empty cells.
+        :type board: list
+        :raises ValueError: If a number is given more than once in a row, column or subgrid.
+        :return: None
+        """
+        for number in range(9):
+            row = [board[number][column] for column in range(9)]
+            column = [board[row_number][number] for row_number in range(9)]
+            subgrid = [board[number // 3 * 3 + row_number][number % 3 * 3 + column_number]
+                       for row_number in range(3) for column_number in range(3)]
+            for name, values in (('row', row), ('column', column), ('subgrid', subgrid)):
+                given_values = [value for value in values if value != 0]
+                if len(given_values) != len(set(given_values)):
+                    raise ValueError(f'{name} {number + 1} has duplicate given numbers')
+
     def solve_sudoku(self):
         """
         This function solves the sudoku puzzle using a genetic algorithm.
@@ -30,7 +57,7 @@ class Sudoku:
         # Generate a population of candidate answers
         self.population = Population(number_of_candidates, self.given_board)
         for generation_number in range(number_of_generations):
-            print(f'\nGeneration #{generation_number} is started...')
+            print(f'\nGeneration #{generation_number} is started...', file=sys.stderr)
             # Here we find the best fitness score of current population
             # and fitness score 1 means that we have found the answer so we return it
             best_fitness_score = 0.0
@@ -38,27 +65,25 @@ class Sudoku:
                 if best_fitness_score < candidate.fitness_score:
                     best_fitness_score = candidate.fitness_score
                 if best_fitness_score == 1:
-                    print(f'Solution is found...\n')
+                    print(f'Solution is found...\n', file=sys.stderr)
                     return candidate
-            print(f'Best fitness score now is {best_fitness_score}...')
+            print(f'Best fitness score now is {best_fitness_score}...', file=sys.stderr)
             # If we pass previous code, means that we did not find the answer
             # So we are going to generate next generation
-            new_generation = list()
+            # The boards of the offspring pool are reused, so no new board is allocated here
+            offspring = self.population.offspring
             # Firstly, we are going to do the cross over to generate new offsprings and complete the population
             # And after that mutation each of which
-            for _ in range(0, number_of_candidates, 2):
+            for index in range(0, len(offspring), 2):
                 # Here, two offsprings will be generated
                 parent_one = self.cross_over.tournament_selection(self.population.candidates, selection_rate)
                 parent_two = self.cross_over.tournament_selection(self.population.candidates, selection_rate)
-                child_one, child_two = self.cross_over.cross_over(parent_one, parent_two, cross_over_rate)
+                child_one, child_two = offspring[index], offspring[index + 1]
+                self.cross_over.cross_over_into(parent_one, parent_two, child_one, child_two, cross_over_rate)
                 # Here, they will be mutated
                 child_one.mutate(mutation_rate)
                 child_two.mutate(mutation_rate)
-                # And finally they will be added to the next generation
-                new_generation.append(child_one)
-                new_generation.append(child_two)
             # Finalize new population
-            self.population.candidates = new_generation
-            self.population.update_fitness()
+            self.population.swap_generations()
         
-        print('Unfortunately, no solution found! :)')
+        print('Unfortunately, no solution found! :)', file=sys.stderr)
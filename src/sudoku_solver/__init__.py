@@ -0,0 +1,6 @@
+from .Board import Board
+from .CrossOver import CrossOver
+from .Population import Population
+from .Sudoku import Sudoku
+
+__all__ = ['Board', 'CrossOver', 'Population', 'Sudoku']
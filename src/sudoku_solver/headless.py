@@ -0,0 +1,62 @@
+import sys
+
+from .Sudoku import Sudoku
+
+
+def read_board(file_path: str) -> list:
+    """
+    Read a sudoku problem from a text file.
+
+    The file has 9 lines, each of which has 9 digits. Empty cells are written as 0 or `.`,
+    and any other character (such as spaces) is ignored.
+
+    :param file_path: Path of the file containing the sudoku problem.
+    :type file_path: str
+    :raises ValueError: If the file does not contain a 9x9 sudoku board.
+    :return: A 9x9 2D list representing the sudoku problem.
+    :rtype: list
+    """
+    board = list()
+    with open(file_path) as file:
+        for line in file:
+            row = [0 if character == '.' else int(character) for character in line if character in '.0123456789']
+            if row:
+                board.append(row)
+    if len(board) != 9 or any(len(row) != 9 for row in board):
+        raise ValueError('the file does not contain a 9x9 sudoku board')
+    return board
+
+
+def run_headless(file_path: str) -> None:
+    """
+    Solve the sudoku problem stored in `file_path` and print the solution, without loading the GUI.
+
+    The solution is the only output on stdout; progress messages are printed on stderr.
+    If the file cannot be read or the sudoku problem is invalid, the process exits with an error message.
+    If no solution is found, the process exits with status 1.
+
+    :param file_path: Path of the file containing the sudoku problem.
+    :type file_path: str
+    :return: None
+    """
+    try:
+        sudoku_solver = Sudoku(read_board(file_path))
+    except OSError as error:
+        sys.exit(f'{file_path}: {error.strerror}')
+    except ValueError as error:
+        sys.exit(f'{file_path}: {error}')
+    result = sudoku_solver.solve_sudoku()
+    if result is None:
+        sys.exit(1)
+    print(result)
+
+
+def main() -> None:
+    """
+    Entry point of the `sudoku-solver` command, which solves the sudoku problem given as its only argument.
+
+    :return: None
+    """
+    if len(sys.argv) != 2:
+        sys.exit('usage: sudoku-solver PUZZLE_FILE')
+    run_headless(sys.argv[1])
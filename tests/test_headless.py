@@ -0,0 +1,59 @@
+import pytest
+
+from sudoku_solver import Sudoku
+from sudoku_solver.headless import read_board
+
+
+PUZZLE = [
+    [5, 3, 0, 0, 7, 0, 0, 0, 0],
+    [6, 0, 0, 1, 9, 5, 0, 0, 0],
+    [0, 9, 8, 0, 0, 0, 0, 6, 0],
+    [8, 0, 0, 0, 6, 0, 0, 0, 3],
+    [4, 0, 0, 8, 0, 3, 0, 0, 1],
+    [7, 0, 0, 0, 2, 0, 0, 0, 6],
+    [0, 6, 0, 0, 0, 0, 2, 8, 0],
+    [0, 0, 0, 4, 1, 9, 0, 0, 5],
+    [0, 0, 0, 0, 8, 0, 0, 7, 9],
+]
+
+
+def write_puzzle(tmp_path, text):
+    file_path = tmp_path / 'puzzle.txt'
+    file_path.write_text(text)
+    return str(file_path)
+
+
+def test_read_board(tmp_path):
+    lines = [''.join(str(number) for number in row) for row in PUZZLE]
+    # Empty cells may be written as `.` and other characters are ignored
+    lines[0] = '5 3 . . 7 . . . .'
+    file_path = write_puzzle(tmp_path, '\n'.join(lines) + '\n')
+    assert read_board(file_path) == PUZZLE
+
+
+@pytest.mark.parametrize('text', [
+    '',
+    '123456789\n' * 8,
+    '123456789\n' * 10,
+    '12345678\n' + '123456789\n' * 8,
+])
+def test_read_board_wrong_shape(tmp_path, text):
+    with pytest.raises(ValueError, match='9x9'):
+        read_board(write_puzzle(tmp_path, text))
+
+
+def test_check_given_board():
+    Sudoku.check_given_board(PUZZLE)
+
+
+@pytest.mark.parametrize('name, first_cell, second_cell', [
+    ('row', (0, 0), (0, 8)),
+    ('column', (0, 0), (8, 0)),
+    ('subgrid', (0, 0), (2, 2)),
+])
+def test_check_given_board_duplicate(name, first_cell, second_cell):
+    board = [[0 for _ in range(9)] for _ in range(9)]
+    board[first_cell[0]][first_cell[1]] = 4
+    board[second_cell[0]][second_cell[1]] = 4
+    with pytest.raises(ValueError, match=f'{name} 1 has duplicate given numbers'):
+        Sudoku(board)